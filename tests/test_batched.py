@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+faster_whisper = pytest.importorskip("faster_whisper")
+
+from wem2csv import cli
+
+CLIP_S = 1.5
+
+
+def test_prepare_batch_spans_are_seconds(monkeypatch, tmp_path):
+    n = int(CLIP_S * cli.SAMPLE_RATE)
+    monkeypatch.setattr(faster_whisper, "decode_audio", lambda path, sampling_rate: np.zeros(n, np.float32))
+    monkeypatch.setattr(faster_whisper.vad, "get_speech_timestamps",
+                        lambda pcm, options: [{"start": 1600, "end": n - 1600}])
+
+    audio, starts, clips = cli.prepare_batch([tmp_path / "a.ogg", tmp_path / "b.ogg"])
+
+    assert len(audio) == 2 * n
+    assert starts == [0.0, CLIP_S]
+    assert [(c["start"], c["end"]) for c in clips] == [
+        pytest.approx((0.1, CLIP_S - 0.1)),
+        pytest.approx((CLIP_S + 0.1, 2 * CLIP_S - 0.1)),
+    ]
+
+
+def test_transcribe_batch_flags_low_confidence():
+    segments = [
+        SimpleNamespace(start=0.1, text=" Hello.", compression_ratio=1.0, avg_logprob=-0.2),
+        SimpleNamespace(start=CLIP_S + 0.1, text=" la la la", compression_ratio=3.0, avg_logprob=-0.2),
+    ]
+    fake = SimpleNamespace(transcribe=lambda audio, **kw: (iter(segments), None))
+    n = int(CLIP_S * cli.SAMPLE_RATE)
+    prepared = (np.zeros(2 * n, np.float32), [0.0, CLIP_S],
+                [{"start": 0.1, "end": 1.4}, {"start": CLIP_S + 0.1, "end": 2.9}])
+
+    texts, retry = cli.transcribe_batch(fake, prepared, "en", "transcribe")
+
+    assert texts == ["Hello.", "la la la"]
+    assert retry == {1}
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    try:
+        model = faster_whisper.WhisperModel("tiny", device="cpu", compute_type="int8")
+    except Exception as e:
+        pytest.skip(f"Whisper tiny model not available: {e}")
+    return faster_whisper.BatchedInferencePipeline(model=model)
+
+
+def test_transcribe_batch_two_spans(pipeline):
+    rng = np.random.default_rng(0)
+    n = int(CLIP_S * cli.SAMPLE_RATE)
+    audio = (0.01 * rng.standard_normal(2 * n)).astype(np.float32)
+    prepared = (audio, [0.0, CLIP_S], [{"start": 0.0, "end": CLIP_S}, {"start": CLIP_S, "end": 2 * CLIP_S}])
+
+    texts, retry = cli.transcribe_batch(pipeline, prepared, "en", "transcribe")
+
+    assert len(texts) == 2
+    assert all(isinstance(t, str) for t in texts)
+    assert retry <= {0, 1}
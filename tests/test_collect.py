@@ -0,0 +1,31 @@
+import os
+
+from wem2csv import cli
+
+
+def test_place_file_same_file_is_kept(tmp_path):
+    src = tmp_path / "x.wem"
+    src.write_bytes(b"wem")
+    link = tmp_path / "link" / "x.wem"
+    link.parent.mkdir()
+    os.link(src, link)
+
+    cli.place_file(src, src)
+    cli.place_file(src, link)
+
+    assert src.read_bytes() == b"wem"
+    assert os.path.samefile(src, link)
+
+
+def test_collect_skips_wem_collection_under_search_dir(tmp_path):
+    wem_collection = tmp_path / "wem-collection"
+    wem_collection.mkdir()
+    (wem_collection / "x.wem").write_bytes(b"kept")
+    (tmp_path / "game").mkdir()
+    (tmp_path / "game" / "y.wem").write_bytes(b"new")
+
+    copied = cli.stage_collect_wem(["x.wem", "y.wem"], tmp_path, wem_collection, "en")
+
+    assert copied == 1
+    assert (wem_collection / "x.wem").read_bytes() == b"kept"
+    assert (wem_collection / "y.wem").read_bytes() == b"new"
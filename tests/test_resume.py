@@ -0,0 +1,88 @@
+import csv
+import os
+import stat
+import sys
+
+import pytest
+
+from wem2csv import cli
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fake tools are shell scripts")
+
+
+def write_tool(path, script):
+    path.write_text("#!/bin/sh\n" + script + "\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    tools = tmp_path / "tools"
+    tools.mkdir()
+    write_tool(tools / "ww2ogg.exe", 'cp "$1" "${1%.wem}.ogg"')
+    write_tool(tools / "revorb.exe", "exit 0")
+    (tools / "packed_codebooks_aoTuV_603.bin").write_bytes(b"")
+    wem_dir = tmp_path / "wem-collection"
+    wem_dir.mkdir()
+    for name in ("a", "b"):
+        (wem_dir / f"{name}.wem").write_text(name)
+    return tools, wem_dir, tmp_path / "ogg-collection", tmp_path / "voicelines.csv"
+
+
+@pytest.fixture
+def fake_transcriber(monkeypatch):
+    """Transcriber that returns each OGG's content; records the files it was asked for."""
+    calls = []
+
+    def load(*args):
+        def transcribe(oggs, lang_hint, task):
+            calls.append(sorted(ogg.name for ogg in oggs))
+            for ogg in oggs:
+                yield ogg.name, ogg.read_text(), True
+        return transcribe
+
+    monkeypatch.setattr(cli, "load_transcriber", load)
+    return calls
+
+
+def run(workspace, **kw):
+    tools, wem_dir, ogg_dir, out_csv = workspace
+    ww_errs, rv_errs, converted, skipped = cli.stage_convert(wem_dir, ogg_dir, tools, "en")
+    cli.stage_transcribe(ogg_dir, out_csv, "tiny", "auto", "", "en", converted=converted, **kw)
+    with out_csv.open(newline="", encoding="utf-8") as f:
+        rows = [tuple(r) for r in csv.reader(f)][1:]
+    return (ww_errs, rv_errs, sorted(converted), skipped), rows
+
+
+def test_rerun_skips_converted_and_transcribed_files(workspace, fake_transcriber):
+    assert run(workspace) == ((0, 0, ["a.ogg", "b.ogg"], 0), [("a.ogg", "a"), ("b.ogg", "b")])
+    assert run(workspace) == ((0, 0, [], 2), [("a.ogg", "a"), ("b.ogg", "b")])
+    assert fake_transcriber == [["a.ogg", "b.ogg"]]
+
+
+def test_changed_wem_is_converted_and_transcribed_again(workspace, fake_transcriber):
+    _, wem_dir, ogg_dir, _ = workspace
+    run(workspace)
+    wem = wem_dir / "a.wem"
+    wem.write_text("a2")
+    later = (ogg_dir / "a.ogg").stat().st_mtime + 10
+    os.utime(wem, (later, later))
+
+    assert run(workspace) == ((0, 0, ["a.ogg"], 1), [("a.ogg", "a2"), ("b.ogg", "b")])
+    assert fake_transcriber[-1] == ["a.ogg"]
+
+
+def test_revorb_failure_is_converted_again(workspace, fake_transcriber):
+    tools = workspace[0]
+    write_tool(tools / "revorb.exe", "exit 1")
+
+    assert run(workspace)[0] == (0, 2, ["a.ogg", "b.ogg"], 0)
+    assert run(workspace)[0] == (0, 2, ["a.ogg", "b.ogg"], 0)
+
+
+def test_load_done_drops_error_short_and_stale_rows(tmp_path):
+    out_csv = tmp_path / "voicelines.csv"
+    out_csv.write_text('filename,voiceline\na.ogg,hi\nb.ogg,"[ERROR: x]"\nc.ogg\n,\nd.ogg,old\n', encoding="utf-8")
+
+    assert cli.load_done(out_csv, stale=["d.ogg"]) == {"a.ogg", "c.ogg"}
+    assert cli.read_rows(out_csv) == [("a.ogg", "hi"), ("c.ogg", "")]
@@ -0,0 +1,62 @@
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+faster_whisper = pytest.importorskip("faster_whisper")
+
+from wem2csv import cli
+
+DECODE_S = 0.05
+
+
+@pytest.fixture
+def slow_transcriber(monkeypatch, tmp_path):
+    """faster-whisper transcriber whose model takes DECODE_S per file."""
+    monkeypatch.setattr(faster_whisper, "WhisperModel", lambda *a, **kw: object())
+
+    def fake_transcribe_file(model, ogg, lang_hint, task):
+        time.sleep(DECODE_S)
+        return ogg.stem
+
+    monkeypatch.setattr(cli, "transcribe_file", fake_transcribe_file)
+    return cli.load_faster_whisper("tiny", "cpu", "int8", 1, "en", tmp_path)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_listening(port: int) -> None:
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port)).close()
+            return
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+    raise TimeoutError(port)
+
+
+def test_disconnected_client_does_not_block_the_next(slow_transcriber, tmp_path):
+    port = free_port()
+    threading.Thread(target=cli.serve, args=(slow_transcriber, "127.0.0.1", port, "en"), daemon=True).start()
+    wait_listening(port)
+
+    # Ask for 80 files, read the first row and hang up
+    with socket.create_connection(("127.0.0.1", port)) as sock, sock.makefile("rwb") as f:
+        oggs = [str(tmp_path / f"{i:02}.ogg") for i in range(80)]
+        f.write(json.dumps({"oggs": oggs, "language": None, "task": "transcribe"}).encode() + b"\n")
+        f.flush()
+        assert json.loads(f.readline())["ok"]
+
+    start = time.monotonic()
+    rows = list(cli.remote_transcriber(f"127.0.0.1:{port}")([Path(tmp_path / "next.ogg")], None, "transcribe"))
+
+    assert rows == [("next.ogg", "next", True)]
+    # The abandoned request (80 * DECODE_S) was dropped, not transcribed to the end
+    assert time.monotonic() - start < 20 * DECODE_S
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+faster_whisper = pytest.importorskip("faster_whisper")
+
+from wem2csv import cli
+
+DECODE_S = 0.05
+
+
+@pytest.fixture
+def slow_transcriber(monkeypatch, tmp_path):
+    """faster-whisper transcriber whose model takes DECODE_S per file."""
+    monkeypatch.setattr(faster_whisper, "WhisperModel", lambda *a, **kw: object())
+
+    def fake_transcribe_file(model, ogg, lang_hint, task):
+        time.sleep(DECODE_S)
+        return ogg.stem
+
+    monkeypatch.setattr(cli, "transcribe_file", fake_transcribe_file)
+    return cli.load_faster_whisper("tiny", "cpu", "int8", 1, "en", tmp_path)
+
+
+def test_closing_transcriber_drops_queued_files(slow_transcriber, tmp_path):
+    oggs = [tmp_path / f"{i:02}.ogg" for i in range(80)]
+    gen = slow_transcriber(oggs, None, "transcribe")
+    next(gen)
+
+    start = time.monotonic()
+    gen.close()
+
+    # At most the files already running finish; the 70+ queued ones are cancelled
+    assert time.monotonic() - start < 10 * DECODE_S
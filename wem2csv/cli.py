@@ -1,11 +1,22 @@
 import argparse
+import asyncio
+import bisect
+import csv
+import hashlib
+import json
 import locale
+import mmap
 import os
+import queue
 import re
 import shutil
+import socket
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Dict, Iterable
+from typing import TYPE_CHECKING, Callable, List, Tuple, Dict, Iterable, Iterator, Optional, Set
 
 import warnings
 
@@ -19,13 +30,59 @@ warnings.filterwarnings(
     module=r"ctranslate2(\.|$)",
 )
 
-import pandas as pd
-from tqdm import tqdm
-from faster_whisper import WhisperModel
+# numpy, soundfile, tqdm, faster_whisper and torch are imported where they are used,
+# so `wem2csv --help` and the server client start without loading CUDA libraries.
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel
 
 # Supported languages (Whisper ISO codes; UI/audio allowed)
 ALLOWED_LANGS = ["en", "fr", "de", "ja", "ru", "es"]
 
+# *.wem tokens in the TXT listing (matched on raw bytes)
+_WEM_RE = re.compile(rb'([^\s"\'<>|:*?]+\.wem)', re.IGNORECASE)
+
+# Batched Whisper inference: clips per forward pass (1 = decode file by file)
+DEFAULT_BATCH_SIZE = 16
+# Whisper works on 16 kHz audio in 30 s windows; longer clips are decoded file by file
+SAMPLE_RATE = 16000
+WHISPER_WINDOW_S = 30.0
+# Decoding: temperature fallback re-decodes segments that look like hallucination loops.
+# The batched pipeline only decodes at the first temperature, so batch rows that fail
+# these thresholds are re-decoded file by file (see transcribe_batch)
+DECODE_OPTIONS = {
+    "beam_size": 5,
+    "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+    "compression_ratio_threshold": 2.4,
+    "log_prob_threshold": -1.0,
+    "no_speech_threshold": 0.6,
+}
+# Silero VAD tuned for short, silence-padded voice lines; less speech than this is left empty
+VAD_PARAMETERS = {"min_silence_duration_ms": 300, "speech_pad_ms": 100}
+MIN_SPEECH_S = 0.2
+# Files/batches decoded ahead of the GPU by the prefetch thread
+PREFETCH_DEPTH = 4
+# Threads sharing one WhisperModel for file-by-file decoding (CTranslate2 releases the GIL)
+TRANSCRIBE_WORKERS = 4
+# Whisper decoder holds 448 positions; 4 go to the <|sot|><|lang|><|task|><|notimestamps|> prompt
+HF_MAX_NEW_TOKENS = 444
+# Concurrent ww2ogg/revorb subprocesses (each one keeps a core busy)
+CONVERT_WORKERS = os.cpu_count() or 1
+# Ways to place .wem into wem-collection (--copy-mode), fastest first
+COPY_MODES = ["link", "reflink", "copy"]
+# Threads for small-file I/O (collect stage, content hashing); overlaps syscalls
+IO_WORKERS = 32
+# `wem2csv serve`: default port and max size of one request line (list of ogg paths)
+DEFAULT_PORT = 5555
+SERVER_REQUEST_LIMIT = 64 * 1024 * 1024
+# Approximate float16 VRAM footprint per Whisper model size (GB), for picking a quantization tier
+MODEL_VRAM_GB = {"tiny": 1, "base": 1, "small": 2, "medium": 5, "large": 10}
+# Transcription backends selectable via --backend
+BACKENDS = ["faster-whisper", "transformers-compiled"]
+
+# A transcriber maps (oggs, language hint, task) to (filename, text, ok) per file
+Transcriber = Callable[[List[Path], Optional[str], str], Iterator[Tuple[str, str, bool]]]
+
 # ----------------------------- i18n -----------------------------
 I18N: Dict[str, Dict[str, str]] = {
     "en": {
@@ -36,15 +93,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "Audio language: auto|en|fr|de|ja|ru|es (default: auto).",
         "arg_ui_lang": "CLI language: system|en|fr|de|ja|ru|es (default: system).",
         "arg_transcript_lang": "Translate transcripts to 'en' using Whisper (only English is supported).",
+        "arg_batch_size": "Clips per batched Whisper pass; 1 disables batching (default: 16).",
+        "arg_backend": "Transcription backend: faster-whisper|transformers-compiled (default: faster-whisper).",
+        "arg_compute_type": "CTranslate2 compute type: auto|int8|int8_float16|float16|bfloat16 (default: auto, picked from VRAM).",
+        "arg_cache_dir": "Directory for downloaded models and compiled kernels (default: per-user cache).",
+        "arg_copy_mode": "How to collect .wem: link|reflink|copy; falls back to the next (default: link).",
+        "arg_client": "Send transcription to a running `wem2csv serve` at HOST:PORT instead of loading the model.",
+        "serve_desc": "Keep a Whisper model loaded and serve transcription requests from `wem2csv --client`.",
+        "arg_host": "Address to listen on (default: 127.0.0.1).",
+        "arg_port": "Port to listen on (default: 5555).",
         "found_wem_entries": "Found WEM entries in TXT: {n}",
         "copying": "Copying matching .wem files into wem-collection …",
         "copied_n": "Copied: {n}",
         "none_found_abort": "No WEM files found — aborting.",
-        "convert_step": "Converting WEM → OGG via ww2ogg …",
-        "revorb_step": "Normalizing OGG via revorb …",
-        "move_step": "Moving .ogg into ogg-collection …",
+        "convert_step": "Converting WEM → OGG (ww2ogg + revorb) into ogg-collection …",
         "transcribe_step": "Transcribing OGG files …",
         "transcribe_mode": "Transcription device: {device} (compute_type={ctype})",
+        "batched_mode": "Batched inference: up to {n} clips per pass",
+        "batch_fallback": "Batched pass failed ({err}); retrying {n} clip(s) one by one",
+        "server_listening": "Transcription server listening on {addr} (Ctrl+C to stop)",
+        "using_server": "Transcription server: {addr}",
+        "resume_skip": "Resuming: {n} file(s) already in the CSV are skipped",
+        "convert_skip": "Already converted: {n} file(s) with an up-to-date OGG are skipped",
+        "dedup_info": "Identical audio: transcribing {u} unique of {n} files",
         "using_model": "Whisper model: {model}",
         "whisper_lang_hint": "Audio language hint: {lang}",
         "whisper_auto_lang": "Audio language: auto-detect",
@@ -68,15 +139,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "Langue audio : auto|en|fr|de|ja|ru|es (défaut : auto).",
         "arg_ui_lang": "Langue de la CLI : system|en|fr|de|ja|ru|es (défaut : system).",
         "arg_transcript_lang": "Traduire les transcriptions en anglais (Whisper ne supporte que l’anglais).",
+        "arg_batch_size": "Extraits par passe Whisper groupée ; 1 désactive le regroupement (défaut : 16).",
+        "arg_backend": "Moteur de transcription : faster-whisper|transformers-compiled (défaut : faster-whisper).",
+        "arg_compute_type": "Type de calcul CTranslate2 : auto|int8|int8_float16|float16|bfloat16 (défaut : auto, selon la VRAM).",
+        "arg_cache_dir": "Répertoire des modèles téléchargés et noyaux compilés (défaut : cache utilisateur).",
+        "arg_copy_mode": "Mode de collecte des .wem : link|reflink|copy ; repli sur le suivant (défaut : link).",
+        "arg_client": "Envoyer la transcription à un `wem2csv serve` actif sur HOST:PORT au lieu de charger le modèle.",
+        "serve_desc": "Garder un modèle Whisper chargé et traiter les requêtes de `wem2csv --client`.",
+        "arg_host": "Adresse d’écoute (défaut : 127.0.0.1).",
+        "arg_port": "Port d’écoute (défaut : 5555).",
         "found_wem_entries": "Entrées WEM trouvées dans le TXT : {n}",
         "copying": "Copie des fichiers .wem correspondants vers wem-collection …",
         "copied_n": "Copiés : {n}",
         "none_found_abort": "Aucun fichier WEM trouvé — abandon.",
-        "convert_step": "Conversion WEM → OGG via ww2ogg …",
-        "revorb_step": "Normalisation OGG via revorb …",
-        "move_step": "Déplacement des .ogg vers ogg-collection …",
+        "convert_step": "Conversion WEM → OGG (ww2ogg + revorb) vers ogg-collection …",
         "transcribe_step": "Transcription des fichiers OGG …",
         "transcribe_mode": "Périphérique de transcription : {device} (compute_type={ctype})",
+        "batched_mode": "Inférence groupée : jusqu’à {n} extraits par passe",
+        "batch_fallback": "Échec de la passe groupée ({err}) ; nouvelle tentative extrait par extrait ({n})",
+        "server_listening": "Serveur de transcription à l’écoute sur {addr} (Ctrl+C pour arrêter)",
+        "using_server": "Serveur de transcription : {addr}",
+        "resume_skip": "Reprise : {n} fichier(s) déjà présents dans le CSV ignorés",
+        "convert_skip": "Déjà converti : {n} fichier(s) avec un OGG à jour ignorés",
+        "dedup_info": "Audio identique : transcription de {u} fichiers uniques sur {n}",
         "using_model": "Modèle Whisper : {model}",
         "whisper_lang_hint": "Indice de langue audio : {lang}",
         "whisper_auto_lang": "Langue audio : détection automatique",
@@ -100,15 +185,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "Audiosprache: auto|en|fr|de|ja|ru|es (Standard: auto).",
         "arg_ui_lang": "CLI-Sprache: system|en|fr|de|ja|ru|es (Standard: system).",
         "arg_transcript_lang": "Transkripte nach Englisch übersetzen (nur Englisch wird unterstützt).",
+        "arg_batch_size": "Clips pro gebündeltem Whisper-Durchlauf; 1 deaktiviert Batching (Standard: 16).",
+        "arg_backend": "Transkriptions-Backend: faster-whisper|transformers-compiled (Standard: faster-whisper).",
+        "arg_compute_type": "CTranslate2-Rechentyp: auto|int8|int8_float16|float16|bfloat16 (Standard: auto, nach VRAM).",
+        "arg_cache_dir": "Verzeichnis für heruntergeladene Modelle und kompilierte Kernel (Standard: Benutzer-Cache).",
+        "arg_copy_mode": "Wie .wem gesammelt werden: link|reflink|copy; sonst nächste Methode (Standard: link).",
+        "arg_client": "Transkription an laufendes `wem2csv serve` unter HOST:PORT senden statt Modell zu laden.",
+        "serve_desc": "Whisper-Modell geladen halten und Transkriptionsanfragen von `wem2csv --client` bedienen.",
+        "arg_host": "Adresse, auf der gelauscht wird (Standard: 127.0.0.1).",
+        "arg_port": "Port, auf dem gelauscht wird (Standard: 5555).",
         "found_wem_entries": "Gefundene WEM-Einträge in TXT: {n}",
         "copying": "Kopiere passende .wem in wem-collection …",
         "copied_n": "Kopiert: {n}",
         "none_found_abort": "Keine WEM-Dateien gefunden – Abbruch.",
-        "convert_step": "Konvertiere WEM → OGG mit ww2ogg …",
-        "revorb_step": "Normalisiere OGG mit revorb …",
-        "move_step": "Verschiebe .ogg in ogg-collection …",
+        "convert_step": "Konvertiere WEM → OGG (ww2ogg + revorb) nach ogg-collection …",
         "transcribe_step": "Transkribiere OGG-Dateien …",
         "transcribe_mode": "Transkriptionsgerät: {device} (compute_type={ctype})",
+        "batched_mode": "Gebündelte Inferenz: bis zu {n} Clips pro Durchlauf",
+        "batch_fallback": "Gebündelter Durchlauf fehlgeschlagen ({err}); {n} Clip(s) werden einzeln wiederholt",
+        "server_listening": "Transkriptionsserver lauscht auf {addr} (Strg+C zum Beenden)",
+        "using_server": "Transkriptionsserver: {addr}",
+        "resume_skip": "Fortsetzen: {n} Datei(en) bereits in der CSV, übersprungen",
+        "convert_skip": "Bereits konvertiert: {n} Datei(en) mit aktueller OGG übersprungen",
+        "dedup_info": "Identisches Audio: transkribiere {u} eindeutige von {n} Dateien",
         "using_model": "Whisper-Modell: {model}",
         "whisper_lang_hint": "Audio-Sprache (Hint): {lang}",
         "whisper_auto_lang": "Audio-Sprache: automatische Erkennung",
@@ -132,15 +231,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "音声言語: auto|en|fr|de|ja|ru|es（既定: auto）。",
         "arg_ui_lang": "CLI言語: system|en|fr|de|ja|ru|es（既定: system）。",
         "arg_transcript_lang": "転写を英語に翻訳（Whisperは英語のみ対応）。",
+        "arg_batch_size": "Whisper バッチ処理 1 回あたりのクリップ数。1 でバッチ無効（既定: 16）",
+        "arg_backend": "転写バックエンド: faster-whisper|transformers-compiled（既定: faster-whisper）",
+        "arg_compute_type": "CTranslate2 の計算型: auto|int8|int8_float16|float16|bfloat16（既定: auto、VRAM に応じて選択）",
+        "arg_cache_dir": "ダウンロード済みモデルとコンパイル済みカーネルの保存先（既定: ユーザーキャッシュ）",
+        "arg_copy_mode": ".wem の収集方法: link|reflink|copy。失敗時は次の方法（既定: link）",
+        "arg_client": "モデルを読み込まず、HOST:PORT で稼働中の `wem2csv serve` に転写を依頼。",
+        "serve_desc": "Whisper モデルを常駐させ、`wem2csv --client` からの転写要求を処理。",
+        "arg_host": "待ち受けアドレス（既定: 127.0.0.1）。",
+        "arg_port": "待ち受けポート（既定: 5555）。",
         "found_wem_entries": "TXT内の WEM エントリ: {n}",
         "copying": "一致する .wem を wem-collection にコピー中 …",
         "copied_n": "コピー数: {n}",
         "none_found_abort": "WEM ファイルが見つかりません — 中止。",
-        "convert_step": "ww2ogg による WEM → OGG 変換中 …",
-        "revorb_step": "revorb による OGG 正規化中 …",
-        "move_step": ".ogg を ogg-collection へ移動中 …",
+        "convert_step": "ww2ogg + revorb による WEM → OGG 変換（ogg-collection へ）中 …",
         "transcribe_step": "OGG を転写中 …",
         "transcribe_mode": "転写デバイス: {device} (compute_type={ctype})",
+        "batched_mode": "バッチ推論: 1 回あたり最大 {n} クリップ",
+        "batch_fallback": "バッチ処理に失敗しました（{err}）。{n} クリップを個別に再試行します",
+        "server_listening": "転写サーバー待ち受け中: {addr}（Ctrl+C で停止）",
+        "using_server": "転写サーバー: {addr}",
+        "resume_skip": "再開: CSV に既にある {n} 件をスキップ",
+        "convert_skip": "変換済み: OGG が最新の {n} 件をスキップ",
+        "dedup_info": "同一音声: {n} 件中 {u} 件の固有ファイルを転写",
         "using_model": "Whisperモデル: {model}",
         "whisper_lang_hint": "音声言語ヒント: {lang}",
         "whisper_auto_lang": "音声言語: 自動検出",
@@ -164,15 +277,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "Язык аудио: auto|en|fr|de|ja|ru|es (по умолчанию: auto).",
         "arg_ui_lang": "Язык CLI: system|en|fr|de|ja|ru|es (по умолчанию: system).",
         "arg_transcript_lang": "Перевод транскриптов на английский (Whisper поддерживает только английский).",
+        "arg_batch_size": "Клипов за один пакетный проход Whisper; 1 отключает пакеты (по умолчанию: 16).",
+        "arg_backend": "Движок транскрибирования: faster-whisper|transformers-compiled (по умолчанию: faster-whisper).",
+        "arg_compute_type": "Тип вычислений CTranslate2: auto|int8|int8_float16|float16|bfloat16 (по умолчанию: auto, по объёму VRAM).",
+        "arg_cache_dir": "Каталог для загруженных моделей и скомпилированных ядер (по умолчанию: кэш пользователя).",
+        "arg_copy_mode": "Способ сбора .wem: link|reflink|copy; при ошибке — следующий (по умолчанию: link).",
+        "arg_client": "Передавать транскрибирование запущенному `wem2csv serve` на HOST:PORT вместо загрузки модели.",
+        "serve_desc": "Держать модель Whisper загруженной и обслуживать запросы `wem2csv --client`.",
+        "arg_host": "Адрес для прослушивания (по умолчанию: 127.0.0.1).",
+        "arg_port": "Порт для прослушивания (по умолчанию: 5555).",
         "found_wem_entries": "Найдено WEM-элементов в TXT: {n}",
         "copying": "Копирование подходящих .wem в wem-collection …",
         "copied_n": "Скопировано: {n}",
         "none_found_abort": "Файлы WEM не найдены — останов.",
-        "convert_step": "Преобразование WEM → OGG через ww2ogg …",
-        "revorb_step": "Нормализация OGG через revorb …",
-        "move_step": "Перемещение .ogg в ogg-collection …",
+        "convert_step": "Преобразование WEM → OGG (ww2ogg + revorb) в ogg-collection …",
         "transcribe_step": "Транскрибирование OGG-файлов …",
         "transcribe_mode": "Устройство транскрибирования: {device} (compute_type={ctype})",
+        "batched_mode": "Пакетный вывод: до {n} клипов за проход",
+        "batch_fallback": "Пакетный проход не удался ({err}); повтор по одному для клипов: {n}",
+        "server_listening": "Сервер транскрибирования слушает {addr} (Ctrl+C для остановки)",
+        "using_server": "Сервер транскрибирования: {addr}",
+        "resume_skip": "Продолжение: пропущено файлов, уже имеющихся в CSV: {n}",
+        "convert_skip": "Уже сконвертировано: пропущено файлов с актуальным OGG: {n}",
+        "dedup_info": "Одинаковое аудио: транскрибируется {u} уникальных из {n} файлов",
         "using_model": "Модель Whisper: {model}",
         "whisper_lang_hint": "Подсказка языка аудио: {lang}",
         "whisper_auto_lang": "Язык аудио: авто-определение",
@@ -196,15 +323,29 @@ I18N: Dict[str, Dict[str, str]] = {
         "arg_audio_lang": "Idioma del audio: auto|en|fr|de|ja|ru|es (predeterminado: auto).",
         "arg_ui_lang": "Idioma de la CLI: system|en|fr|de|ja|ru|es (predeterminado: system).",
         "arg_transcript_lang": "Traducir transcripciones al inglés (Whisper solo admite inglés).",
+        "arg_batch_size": "Clips por pasada por lotes de Whisper; 1 desactiva los lotes (predeterminado: 16).",
+        "arg_backend": "Motor de transcripción: faster-whisper|transformers-compiled (predeterminado: faster-whisper).",
+        "arg_compute_type": "Tipo de cómputo de CTranslate2: auto|int8|int8_float16|float16|bfloat16 (predeterminado: auto, según la VRAM).",
+        "arg_cache_dir": "Directorio para modelos descargados y kernels compilados (predeterminado: caché del usuario).",
+        "arg_copy_mode": "Cómo recopilar .wem: link|reflink|copy; si falla, el siguiente (predeterminado: link).",
+        "arg_client": "Enviar la transcripción a un `wem2csv serve` activo en HOST:PORT en lugar de cargar el modelo.",
+        "serve_desc": "Mantener un modelo Whisper cargado y atender solicitudes de `wem2csv --client`.",
+        "arg_host": "Dirección de escucha (predeterminado: 127.0.0.1).",
+        "arg_port": "Puerto de escucha (predeterminado: 5555).",
         "found_wem_entries": "Entradas WEM encontradas en TXT: {n}",
         "copying": "Copiando .wem coincidentes a wem-collection …",
         "copied_n": "Copiados: {n}",
         "none_found_abort": "No se encontraron archivos WEM — cancelando.",
-        "convert_step": "Convirtiendo WEM → OGG con ww2ogg …",
-        "revorb_step": "Normalizando OGG con revorb …",
-        "move_step": "Moviendo .ogg a ogg-collection …",
+        "convert_step": "Convirtiendo WEM → OGG (ww2ogg + revorb) en ogg-collection …",
         "transcribe_step": "Transcribiendo archivos OGG …",
         "transcribe_mode": "Dispositivo de transcripción: {device} (compute_type={ctype})",
+        "batched_mode": "Inferencia por lotes: hasta {n} clips por pasada",
+        "batch_fallback": "Falló la pasada por lotes ({err}); reintentando {n} clip(s) uno a uno",
+        "server_listening": "Servidor de transcripción escuchando en {addr} (Ctrl+C para detener)",
+        "using_server": "Servidor de transcripción: {addr}",
+        "resume_skip": "Reanudando: se omiten {n} archivo(s) ya presentes en el CSV",
+        "convert_skip": "Ya convertidos: se omiten {n} archivo(s) con un OGG actualizado",
+        "dedup_info": "Audio idéntico: transcribiendo {u} archivos únicos de {n}",
         "using_model": "Modelo Whisper: {model}",
         "whisper_lang_hint": "Idioma de audio (sugerencia): {lang}",
         "whisper_auto_lang": "Idioma de audio: autodetección",
@@ -223,11 +364,11 @@ I18N: Dict[str, Dict[str, str]] = {
 }
 
 
-def tr(lang: str, key: str, **kw) -> str:
+def tr(ui_lang: str, key: str, **kw) -> str:
     """Return localized string for key in given language (fallback to English)."""
-    if lang not in I18N:
-        lang = "en"
-    return I18N[lang].get(key, I18N["en"].get(key, key)).format(**kw)
+    if ui_lang not in I18N:
+        ui_lang = "en"
+    return I18N[ui_lang].get(key, I18N["en"].get(key, key)).format(**kw)
 
 
 # ----------------------------- helpers -----------------------------
@@ -252,106 +393,692 @@ def detect_system_lang() -> str:
     return code if code in ALLOWED_LANGS else "en"
 
 
-def run_cmd(cmd: List[str], cwd: Path = None) -> Tuple[int, str]:
-    """Run a subprocess command and capture stdout/stderr."""
-    result = subprocess.run(
-        cmd, cwd=str(cwd) if cwd else None,
-        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+async def run_cmd(cmd: List[str], cwd: Path = None) -> Tuple[int, str]:
+    """Run a subprocess command (asyncio) and capture stdout/stderr."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, cwd=str(cwd) if cwd else None,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
     )
-    return result.returncode, result.stdout.strip()
+    out, _ = await proc.communicate()
+    return proc.returncode, out.decode(locale.getpreferredencoding(False), errors="replace").strip()
 
 
 def extract_wem_names(text_path: Path) -> List[str]:
     """Extract unique *.wem tokens from a text file (basename only)."""
-    text = text_path.read_text(encoding="utf-8", errors="ignore")
-    names = {Path(m).name for m in re.findall(r'([^\s"\'<>|:*?]+\.wem)', text, flags=re.IGNORECASE)}
+    if text_path.stat().st_size == 0:
+        return []
+    # Scan the memory-mapped bytes: no full decode/copy of large TXT dumps
+    with open(text_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        names = {
+            m.group(1).decode("utf-8", "ignore").rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+            for m in _WEM_RE.finditer(mm)
+        }
     return list(names)
 
 
+def _pbar(iterable=None, total: Optional[int] = None, **kw):
+    """tqdm with throttled redraws (every 0.5 s and ~200 steps at most): terminal writes are slow."""
+    from tqdm import tqdm
+
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    return tqdm(iterable, total=total, mininterval=0.5, miniters=max(1, (total or 0) // 200), smoothing=0.05, **kw)
+
+
 def safe_mkdir(path: Path) -> None:
     """Create a directory if it doesn't exist."""
     path.mkdir(parents=True, exist_ok=True)
 
 
-def choose_device_and_compute_type() -> Tuple[str, str]:
-    """Prefer CUDA if available; otherwise CPU int8."""
+def default_cache_dir() -> Path:
+    """Per-user cache directory for model files: %LOCALAPPDATA%\\wem2csv\\Cache or ~/.cache/wem2csv."""
+    if os.name == "nt":
+        return Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local") / "wem2csv" / "Cache"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "wem2csv"
+
+
+def choose_device_and_compute_type(model_name: str = "small", override: str = "auto") -> Tuple[str, str]:
+    """
+    Prefer CUDA if available; otherwise CPU int8.
+    On CUDA the quantization tier follows the VRAM available for the model:
+    float16 with plenty of headroom, int8_float16 in the middle, int8 when tight.
+    An explicit override (any CTranslate2 compute type) wins.
+    """
+    device, compute_type = "cpu", "int8"
     try:
         import torch  # noqa
         if torch.cuda.is_available():
-            return "cuda", "int8_float16"
+            device, compute_type = "cuda", "int8_float16"
+            vram_gb = torch.cuda.get_device_properties(0).total_memory / 1024 ** 3
+            need_gb = next((gb for key, gb in MODEL_VRAM_GB.items() if key in model_name), MODEL_VRAM_GB["large"])
+            if vram_gb >= 2 * need_gb:
+                compute_type = "float16"
+            elif vram_gb < need_gb:
+                compute_type = "int8"
     except Exception:
         pass
-    return "cpu", "int8"
+    if override and override != "auto":
+        compute_type = override
+    return device, compute_type
+
+
+def _reflink_copy(src: Path, dst: Path) -> None:
+    """Copy via os.copy_file_range, which shares extents on CoW filesystems (Btrfs, XFS)."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                break
+            remaining -= n
+    shutil.copystat(src, dst)
+
+
+def place_file(src: Path, dst: Path, mode: str = "link") -> None:
+    """
+    Place src at dst as cheaply as the mode allows, falling back to slower methods:
+    link (hardlink, same filesystem) → reflink (copy_file_range) → copy (shutil.copy2).
+    If dst already is src (same path or hardlink), it is left untouched.
+    """
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return
+        dst.unlink()
+    if mode == "link":
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    if mode in ("link", "reflink") and hasattr(os, "copy_file_range"):
+        try:
+            _reflink_copy(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def file_digest(path: Path) -> str:
+    """Content hash of a file (BLAKE2b, 128 bit)."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def group_identical(paths: List[Path]) -> Dict[Path, List[Path]]:
+    """Group files with identical content; maps the first file of each group to the whole group."""
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as ex:
+        digests = list(ex.map(file_digest, paths))
+    groups: Dict[str, List[Path]] = {}
+    for path, digest in zip(paths, digests):
+        groups.setdefault(digest, []).append(path)
+    return {group[0]: group for group in groups.values()}
+
+
+def audio_duration(path: Path) -> float:
+    """Return the duration of an audio file in seconds (0.0 if unreadable)."""
+    import soundfile as sf
+
+    try:
+        return sf.info(str(path)).duration
+    except Exception:
+        return 0.0
+
+
+def make_batches(oggs: List[Path], batch_size: int) -> Tuple[List[List[Path]], List[Path]]:
+    """
+    Group clips of similar length into batches of at most batch_size.
+    Clips longer than one Whisper window (or unreadable) are returned separately
+    for file-by-file decoding.
+    """
+    durations = {ogg: audio_duration(ogg) for ogg in oggs}
+    short = sorted((o for o in oggs if 0.0 < durations[o] <= WHISPER_WINDOW_S), key=durations.get)
+    single = [o for o in oggs if not 0.0 < durations[o] <= WHISPER_WINDOW_S]
+    batches = [short[i:i + batch_size] for i in range(0, len(short), batch_size)]
+    return batches, single
+
+
+def transcribe_file(model: "WhisperModel", ogg: Path, lang_hint: str, task: str) -> str:
+    """Transcribe a single file with the sequential faster-whisper decoder."""
+    segments, info = model.transcribe(
+        str(ogg),
+        language=lang_hint,
+        vad_filter=True,
+        vad_parameters=VAD_PARAMETERS,
+        best_of=5,
+        condition_on_previous_text=False,
+        task=task,
+        **DECODE_OPTIONS,
+    )
+    # Segments decode lazily: a clip without real speech is never sent to the decoder
+    if info.duration_after_vad < MIN_SPEECH_S:
+        return ""
+    return "".join(seg.text for seg in segments).strip()
+
+
+def prefetch(items: list, load: Callable) -> Iterator[tuple]:
+    """
+    Yield (item, load(item)) while a background thread loads the next items into
+    a bounded queue, so CPU-side decoding overlaps GPU work on the current item.
+    A failed load yields the exception instead of the value.
+    """
+    q: queue.Queue = queue.Queue(maxsize=PREFETCH_DEPTH)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
+    def producer() -> None:
+        for item in items:
+            try:
+                value = load(item)
+            except Exception as e:
+                value = e
+            if not put((item, value)):
+                return
+        put(done)
 
-def list_files(root: Path) -> Iterable[Path]:
-    """Yield files recursively under root."""
-    for dirpath, _, filenames in os.walk(root):
-        for f in filenames:
-            yield Path(dirpath) / f
+    threading.Thread(target=producer, daemon=True).start()
+    try:
+        while True:
+            entry = q.get()
+            if entry is done:
+                return
+            yield entry
+    finally:
+        stop.set()
+
+
+def prepare_batch(batch: List[Path]) -> Tuple["np.ndarray", List[float], List[dict]]:
+    """
+    CPU side of a batched pass: decode the clips to 16 kHz, concatenate them and
+    return (audio, start time of each clip, clip spans). Each span is trimmed to
+    its VAD speech region and given in seconds, as clip_timestamps expects;
+    clips without speech get no span.
+    """
+    import numpy as np
+    from faster_whisper import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    vad_options = VadOptions(**VAD_PARAMETERS)
+    pcms = [decode_audio(str(ogg), sampling_rate=SAMPLE_RATE) for ogg in batch]
+    starts, clips, pos = [], [], 0
+    for pcm in pcms:
+        starts.append(pos / SAMPLE_RATE)
+        speech = get_speech_timestamps(pcm, vad_options) if len(pcm) else []
+        if sum(ts["end"] - ts["start"] for ts in speech) >= MIN_SPEECH_S * SAMPLE_RATE:
+            clips.append({
+                "start": (pos + speech[0]["start"]) / SAMPLE_RATE,
+                "end": (pos + speech[-1]["end"]) / SAMPLE_RATE,
+            })
+        pos += len(pcm)
+    return np.concatenate(pcms), starts, clips
+
+
+def transcribe_batch(
+    pipeline, prepared: Tuple["np.ndarray", List[float], List[dict]], lang_hint: str, task: str
+) -> Tuple[List[str], Set[int]]:
+    """
+    Transcribe several short clips (from prepare_batch) in one batched forward pass.
+    Each clip span becomes one padded row of the batch; segments are mapped back
+    to their clip by start time.
+    Returns (texts, indices of low-confidence clips). The pipeline has no
+    temperature fallback, so those clips should be re-decoded with transcribe_file.
+    """
+    audio, starts, clips = prepared
+    texts = [""] * len(starts)
+    retry: Set[int] = set()
+    if not clips:
+        return texts, retry
+    segments, _ = pipeline.transcribe(
+        audio,
+        language=lang_hint,
+        task=task,
+        clip_timestamps=clips,
+        batch_size=len(clips),
+        **DECODE_OPTIONS,
+    )
+    for seg in segments:
+        idx = bisect.bisect_right(starts, seg.start + 1e-3) - 1
+        texts[idx] += seg.text
+        if (seg.compression_ratio > DECODE_OPTIONS["compression_ratio_threshold"]
+                or seg.avg_logprob < DECODE_OPTIONS["log_prob_threshold"]):
+            retry.add(idx)
+    return [t.strip() for t in texts], retry
+
+
+def _walk_wem(root: Path, targets_lower: Set[str], exclude: Optional[Path] = None) -> Iterable[str]:
+    """
+    Yield paths of files under root whose lowercased name is in targets_lower.
+    Stack-based os.scandir walk: DirEntry caches name/type, so no Path is built
+    for non-matching entries; hidden directories and exclude are skipped.
+    """
+    skip = os.path.normcase(os.path.abspath(exclude)) if exclude is not None else None
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and (
+                            skip is None or os.path.normcase(os.path.abspath(entry.path)) != skip
+                        ):
+                            stack.append(entry.path)
+                    elif entry.name.lower() in targets_lower and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
 
 
 # ----------------------------- pipeline steps -----------------------------
 
-def stage_collect_wem(wem_names: List[str], search_dir: Path, wem_collection: Path, ui_lang: str) -> int:
+def stage_collect_wem(
+    wem_names: List[str], search_dir: Path, wem_collection: Path, ui_lang: str, copy_mode: str = "link"
+) -> int:
     """Collect *.wem listed in TXT into wem-collection."""
     print(tr(ui_lang, "copying"))
     safe_mkdir(wem_collection)
     targets_lower = {n.lower() for n in wem_names}
-    copied = 0
-    for p in list_files(search_dir):
-        if p.suffix.lower() == ".wem" and p.name.lower() in targets_lower:
-            shutil.copy2(p, wem_collection / p.name)
-            copied += 1
+    # Same basename in several folders: the last one found wins, as with sequential copies.
+    # Keyed case-insensitively: X.WEM and x.wem are one destination file on NTFS
+    hits: Dict[str, Path] = {}
+    # wem-collection may sit under search_dir; never collect it into itself
+    for path in _walk_wem(search_dir, targets_lower, exclude=wem_collection):
+        p = Path(path)
+        hits[p.name.lower()] = p
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as ex:
+        list(ex.map(lambda p: place_file(p, wem_collection / p.name, copy_mode), hits.values()))
+    copied = len(hits)
     print(tr(ui_lang, "copied_n", n=copied))
     return copied
 
 
-def stage_ww2ogg(wem_collection: Path, tools_dir: Path, ui_lang: str) -> int:
-    """Run ww2ogg for all .wem in wem-collection."""
+def move_file(src: Path, dst: Path) -> None:
+    """Move src to dst, replacing dst if it exists."""
+    # Same filesystem: one atomic rename that also replaces an existing dst
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), dst)
+
+
+async def _process_one_wem(
+    wem: Path, ogg_collection: Path, ww2ogg: Path, codebooks: Path, revorb: Path
+) -> Tuple[str, List[Tuple[str, str]], bool]:
+    """
+    ww2ogg → revorb → move into ogg-collection for one .wem.
+    Returns (name, [(error key, tool output)], moved). As with separate stages,
+    an OGG that revorb fails on is still moved, but dated before its .wem so
+    that the next run converts it again.
+    """
+    rc, out = await run_cmd([str(ww2ogg), str(wem), "--pcb", str(codebooks)], cwd=wem.parent)
+    ogg = wem.with_suffix(".ogg")
+    if rc != 0 or not ogg.exists():
+        return wem.name, [("ww2ogg_err", out)], False
+    errors = []
+    rc, out = await run_cmd([str(revorb), str(ogg)], cwd=wem.parent)
+    if rc != 0:
+        errors.append(("revorb_err", out))
+    # A rename is instant; a cross-drive fallback copy must not stall the event loop
+    dst = ogg_collection / ogg.name
+    await asyncio.to_thread(move_file, ogg, dst)
+    if errors:
+        mtime = wem.stat().st_mtime - 1
+        os.utime(dst, (mtime, mtime))
+    return ogg.name, errors, True
+
+
+def stage_convert(
+    wem_collection: Path, ogg_collection: Path, tools_dir: Path, ui_lang: str
+) -> Tuple[int, int, List[str], int]:
+    """
+    Convert every .wem in wem-collection into a normalized .ogg in ogg-collection.
+    Each file runs through ww2ogg, revorb and the move as one asyncio work unit;
+    a semaphore caps the number of concurrent subprocesses.
+    A .wem whose OGG already sits in ogg-collection with an equal or newer mtime is
+    skipped (Make-style), so a rerun only converts new or changed files.
+    Returns (ww2ogg errors, revorb errors, names of the OGGs moved, skipped).
+    """
     ww2ogg = tools_dir / "ww2ogg.exe"
     codebooks = tools_dir / "packed_codebooks_aoTuV_603.bin"
-    if not ww2ogg.exists():
-        raise FileNotFoundError(tr(ui_lang, "tools_missing", name=ww2ogg.name, dir=str(tools_dir)))
-    if not codebooks.exists():
-        raise FileNotFoundError(tr(ui_lang, "tools_missing", name=codebooks.name, dir=str(tools_dir)))
+    revorb = tools_dir / "revorb.exe"
+    for tool in (ww2ogg, codebooks, revorb):
+        if not tool.exists():
+            raise FileNotFoundError(tr(ui_lang, "tools_missing", name=tool.name, dir=str(tools_dir)))
     print(tr(ui_lang, "convert_step"))
-    errors = 0
-    for wem in tqdm(sorted(wem_collection.glob("*.wem")), desc="ww2ogg", unit="file"):
-        rc, out = run_cmd([str(ww2ogg), str(wem), "--pcb", str(codebooks)], cwd=wem_collection)
-        if rc != 0:
-            errors += 1
-            print(tr(ui_lang, "ww2ogg_err", name=wem.name, out=out))
-    return errors
+    safe_mkdir(ogg_collection)
+
+    jobs: List[Path] = []
+    skipped = 0
+    for wem in sorted(wem_collection.glob("*.wem")):
+        # _process_one_wem backdates an OGG that revorb failed on, so it is not skipped here
+        try:
+            if (ogg_collection / (wem.stem + ".ogg")).stat().st_mtime >= wem.stat().st_mtime:
+                skipped += 1
+                continue
+        except FileNotFoundError:
+            pass
+        jobs.append(wem)
+    if skipped:
+        print(tr(ui_lang, "convert_skip", n=skipped))
 
+    async def convert_all() -> Tuple[int, int, List[str]]:
+        sem = asyncio.Semaphore(CONVERT_WORKERS)
 
-def stage_revorb(wem_collection: Path, tools_dir: Path, ui_lang: str) -> int:
-    """Run revorb for all .ogg in wem-collection."""
-    revorb = tools_dir / "revorb.exe"
-    if not revorb.exists():
-        raise FileNotFoundError(tr(ui_lang, "tools_missing", name=revorb.name, dir=str(tools_dir)))
-    print(tr(ui_lang, "revorb_step"))
-    errors = 0
-    for ogg in tqdm(sorted(wem_collection.glob("*.ogg")), desc="revorb", unit="file"):
-        rc, out = run_cmd([str(revorb), str(ogg)], cwd=wem_collection)
-        if rc != 0:
-            errors += 1
-            print(tr(ui_lang, "revorb_err", name=ogg.name, out=out))
-    return errors
-
-
-def stage_move_ogg(wem_collection: Path, ogg_collection: Path, ui_lang: str) -> int:
-    """Move all .ogg into ogg-collection."""
-    print(tr(ui_lang, "move_step"))
-    safe_mkdir(ogg_collection)
-    moved = 0
-    for ogg in sorted(wem_collection.glob("*.ogg")):
-        dst = ogg_collection / ogg.name
-        if dst.exists():
-            dst.unlink()
-        shutil.move(str(ogg), dst)
-        moved += 1
-    return moved
+        async def one(wem: Path) -> Tuple[str, List[Tuple[str, str]], bool]:
+            async with sem:
+                return await _process_one_wem(wem, ogg_collection, ww2ogg=ww2ogg, codebooks=codebooks, revorb=revorb)
+
+        errors = {"ww2ogg_err": 0, "revorb_err": 0}
+        moved: List[str] = []
+        with _pbar(total=len(jobs), desc="wem→ogg", unit="file") as bar:
+            for coro in asyncio.as_completed([one(wem) for wem in jobs]):
+                name, errs, ok = await coro
+                for key, out in errs:
+                    errors[key] += 1
+                    print(tr(ui_lang, key, name=name, out=out))
+                if ok:
+                    moved.append(name)
+                bar.update(1)
+        return errors["ww2ogg_err"], errors["revorb_err"], moved
+
+    return (*asyncio.run(convert_all()), skipped)
+
+
+def load_faster_whisper(
+    model_name: str, device: str, compute_type: str, batch_size: int, ui_lang: str, cache_dir: Path
+) -> Transcriber:
+    """Load faster-whisper (CTranslate2) once and return a transcriber reusing it."""
+    from faster_whisper import WhisperModel
+
+    # One model replica per worker on GPU; on CPU split the cores between workers
+    cpu_threads = 0 if device == "cuda" else max(1, (os.cpu_count() or 1) // TRANSCRIBE_WORKERS)
+    kwargs = dict(
+        device=device, compute_type=compute_type,
+        num_workers=TRANSCRIBE_WORKERS, cpu_threads=cpu_threads, download_root=str(cache_dir),
+    )
+    # Use the cached copy without touching the Hub; download only on the first run
+    # (huggingface_hub's LocalEntryNotFoundError is a FileNotFoundError; other errors surface as is)
+    try:
+        model = WhisperModel(model_name, local_files_only=True, **kwargs)
+    except FileNotFoundError:
+        model = WhisperModel(model_name, **kwargs)
+
+    # Batched pipeline needs faster-whisper >= 1.1; otherwise decode file by file
+    pipeline = None
+    if batch_size > 1:
+        try:
+            from faster_whisper import BatchedInferencePipeline
+            pipeline = BatchedInferencePipeline(model=model)
+        except ImportError:
+            pass
+    if pipeline is not None:
+        print(tr(ui_lang, "batched_mode", n=batch_size))
+
+    def transcribe(oggs: List[Path], lang_hint: Optional[str], task: str) -> Iterator[Tuple[str, str, bool]]:
+        # Auto-detect runs once per pipeline call, i.e. once for a whole batch, so
+        # without a language hint every file is decoded (and detected) on its own
+        if pipeline is not None and lang_hint:
+            batches, single = make_batches(oggs, batch_size)
+        else:
+            batches, single = [], list(oggs)
+        ex = ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS)
+        try:
+            # File-by-file clips run in the pool while batches are decoded on this thread;
+            # the next batches are decoded/VAD-trimmed in the background meanwhile
+            futs = {ex.submit(transcribe_file, model, ogg, lang_hint, task): ogg for ogg in single}
+            for batch, prepared in prefetch(batches, prepare_batch):
+                try:
+                    if isinstance(prepared, Exception):
+                        raise prepared
+                    texts, retry = transcribe_batch(pipeline, prepared, lang_hint, task)
+                except Exception as e:
+                    # Retry the clips one by one so a single bad file does not fail the batch
+                    print(tr(ui_lang, "batch_fallback", n=len(batch), err=e))
+                    for ogg in batch:
+                        futs[ex.submit(transcribe_file, model, ogg, lang_hint, task)] = ogg
+                    continue
+                for i, (ogg, text) in enumerate(zip(batch, texts)):
+                    if i in retry:
+                        futs[ex.submit(transcribe_file, model, ogg, lang_hint, task)] = ogg
+                    else:
+                        yield ogg.name, text, True
+            for fut in as_completed(futs):
+                try:
+                    text, ok = fut.result(), True
+                except Exception as e:
+                    text, ok = f"[ERROR: {e}]", False
+                yield futs[fut].name, text, ok
+        finally:
+            # Ctrl+C or a closed generator: drop the queued files instead of decoding them all
+            ex.shutdown(wait=False, cancel_futures=True)
+
+    return transcribe
+
+
+def load_compiled(model_name: str, device: str, cache_dir: Path) -> Transcriber:
+    """
+    Load transformers Whisper with a static KV cache and, on CUDA, a
+    torch.compile'd forward (mode="reduce-overhead" captures CUDA graphs).
+    The returned transcriber keeps the model alive, so the captured graphs are reused.
+    Compiled Inductor kernels are cached under cache_dir for later runs.
+    """
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir / "inductor"))
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+    import numpy as np
+    import soundfile as sf
+    import torch
+    import torchaudio
+    from transformers import WhisperForConditionalGeneration, WhisperProcessor
+
+    repo = model_name if "/" in model_name else f"openai/whisper-{model_name}"
+    dtype = torch.float16 if device == "cuda" else torch.float32
+    # Use the cached copy without touching the Hub; download only on the first run
+    try:
+        processor = WhisperProcessor.from_pretrained(repo, cache_dir=cache_dir, local_files_only=True)
+        model = WhisperForConditionalGeneration.from_pretrained(
+            repo, torch_dtype=dtype, cache_dir=cache_dir, local_files_only=True
+        )
+    except OSError:
+        processor = WhisperProcessor.from_pretrained(repo, cache_dir=cache_dir)
+        model = WhisperForConditionalGeneration.from_pretrained(repo, torch_dtype=dtype, cache_dir=cache_dir)
+    model = model.to(device)
+    model.generation_config.cache_implementation = "static"
+    if device == "cuda":
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=True)
+
+    def load_pcm(ogg: Path) -> "np.ndarray":
+        data, sr = sf.read(str(ogg), dtype="float32", always_2d=True)
+        pcm = torch.from_numpy(data.mean(axis=1))
+        if sr != SAMPLE_RATE:
+            pcm = torchaudio.functional.resample(pcm, sr, SAMPLE_RATE)
+        return pcm.numpy()
+
+    def generate(pcm: "np.ndarray", lang_hint: Optional[str], task: str, **kw) -> str:
+        if len(pcm) > WHISPER_WINDOW_S * SAMPLE_RATE:
+            # Long-form: keep the full clip and let generate() walk the windows
+            inputs = processor(pcm, sampling_rate=SAMPLE_RATE, return_tensors="pt",
+                               truncation=False, padding="longest", return_attention_mask=True)
+        else:
+            inputs = processor(pcm, sampling_rate=SAMPLE_RATE, return_tensors="pt")
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+        inputs["input_features"] = inputs["input_features"].to(dtype)
+        with torch.inference_mode():
+            ids = model.generate(**inputs, language=lang_hint, task=task,
+                                 max_new_tokens=HF_MAX_NEW_TOKENS, **kw)
+        return processor.batch_decode(ids, skip_special_tokens=True)[0].strip()
+
+    if device == "cuda":
+        # Warm up at full length so every decode step of the static cache is captured
+        warmup = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        for _ in range(2):
+            generate(warmup, None, "transcribe", min_new_tokens=HF_MAX_NEW_TOKENS)
+
+    def transcribe(oggs: List[Path], lang_hint: Optional[str], task: str) -> Iterator[Tuple[str, str, bool]]:
+        for ogg, pcm in prefetch(oggs, load_pcm):
+            try:
+                if isinstance(pcm, Exception):
+                    raise pcm
+                text, ok = generate(pcm, lang_hint, task), True
+            except Exception as e:
+                text, ok = f"[ERROR: {e}]", False
+            yield ogg.name, text, ok
+
+    return transcribe
+
+
+def load_transcriber(
+    backend: str, model_name: str, compute_type: str, batch_size: int, ui_lang: str, cache_dir: Path
+) -> Transcriber:
+    """Pick device/compute type, report them and load the selected backend."""
+    device, compute_type = choose_device_and_compute_type(model_name, compute_type)
+    if backend == "transformers-compiled":
+        compute_type = "float16" if device == "cuda" else "float32"
+    print(tr(ui_lang, "transcribe_mode", device=device, ctype=compute_type))
+    print(tr(ui_lang, "using_model", model=model_name))
+    safe_mkdir(cache_dir)
+    if backend == "transformers-compiled":
+        return load_compiled(model_name, device, cache_dir)
+    return load_faster_whisper(model_name, device, compute_type, batch_size, ui_lang, cache_dir)
+
+
+def remote_transcriber(address: str) -> Transcriber:
+    """Return a transcriber that forwards requests to a `wem2csv serve` process at host:port."""
+    host, _, port = address.rpartition(":")
+
+    def transcribe(oggs: List[Path], lang_hint: Optional[str], task: str) -> Iterator[Tuple[str, str, bool]]:
+        request = {"oggs": [str(ogg.resolve()) for ogg in oggs], "language": lang_hint, "task": task}
+        with socket.create_connection((host or "127.0.0.1", int(port))) as sock, sock.makefile("rwb") as f:
+            f.write(json.dumps(request).encode("utf-8") + b"\n")
+            f.flush()
+            for line in f:
+                msg = json.loads(line)
+                if "error" in msg:
+                    raise RuntimeError(msg["error"])
+                if msg.get("done"):
+                    return
+                yield msg["filename"], msg["voiceline"], msg["ok"]
+        raise ConnectionError(address)
+
+    return transcribe
+
+
+def serve(transcribe: Transcriber, host: str, port: int, ui_lang: str) -> None:
+    """
+    Keep a loaded model resident and serve transcription requests.
+    Protocol: one JSON request line {"oggs", "language", "task"}; the reply is one
+    JSON line per file {"filename", "voiceline", "ok"}, then {"done": true} or {"error"}.
+    The ogg paths must be readable by the server. Requests are handled one at a time.
+    """
+    lock = asyncio.Lock()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def work(req: dict) -> None:
+            msg = {"done": True}
+            try:
+                oggs = [Path(p) for p in req["oggs"]]
+                rows = transcribe(oggs, req.get("language"), req.get("task", "transcribe"))
+                try:
+                    for name, text, ok in rows:
+                        if stop.is_set():
+                            break
+                        loop.call_soon_threadsafe(queue.put_nowait, {"filename": name, "voiceline": text, "ok": ok})
+                finally:
+                    # Closing the transcriber cancels the files it still has queued
+                    rows.close()
+            except Exception as e:
+                msg = {"error": str(e)}
+            loop.call_soon_threadsafe(queue.put_nowait, msg)
+
+        async def watch_client() -> None:
+            # The client sends nothing after its request, so EOF means it went away
+            try:
+                await reader.read()
+            except ConnectionError:
+                pass
+            queue.put_nowait(None)
+
+        async with lock:
+            try:
+                req = json.loads(await reader.readline())
+                work_fut = loop.run_in_executor(None, work, req)
+                gone = asyncio.ensure_future(watch_client())
+                try:
+                    while True:
+                        msg = await queue.get()
+                        if msg is None:
+                            break
+                        writer.write(json.dumps(msg).encode("utf-8") + b"\n")
+                        await writer.drain()
+                        if "done" in msg or "error" in msg:
+                            break
+                finally:
+                    # Client gone or finished: stop producing and let the worker wind down
+                    stop.set()
+                    gone.cancel()
+                    await work_fut
+            except (ValueError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+    async def run() -> None:
+        server = await asyncio.start_server(handle, host, port, limit=SERVER_REQUEST_LIMIT)
+        print(tr(ui_lang, "server_listening", addr=f"{host}:{port}"))
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def write_csv_header(out_csv: Path, rows: List[Tuple[str, str]] = ()) -> None:
+    """(Re)create out_csv with the header and the given rows (atomically, via a temp file)."""
+    tmp = out_csv.with_name(out_csv.name + ".tmp")
+    with tmp.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["filename", "voiceline"])
+        w.writerows(rows)
+    os.replace(tmp, out_csv)
+
+
+def read_rows(out_csv: Path) -> List[Tuple[str, str]]:
+    """Return the (filename, voiceline) rows of an existing CSV."""
+    with out_csv.open(newline="", encoding="utf-8") as f:
+        # Short rows read as None fields; a row without a filename is dropped
+        return [(r["filename"], r.get("voiceline") or "") for r in csv.DictReader(f) if r.get("filename")]
+
+
+def load_done(out_csv: Path, stale: Iterable[str] = ()) -> Set[str]:
+    """
+    Return filenames already transcribed in an existing CSV, for resuming.
+    Error rows and rows of stale files (OGGs converted again since) are dropped
+    from the file so those clips are transcribed again.
+    """
+    if not out_csv.exists() or out_csv.stat().st_size == 0:
+        return set()
+    rows = read_rows(out_csv)
+    stale = set(stale)
+    kept = [r for r in rows if not r[1].startswith("[ERROR:") and r[0] not in stale]
+    if len(kept) < len(rows):
+        write_csv_header(out_csv, kept)
+    return {name for name, _ in kept}
 
 
 def stage_transcribe(
@@ -361,25 +1088,34 @@ def stage_transcribe(
     audio_lang: str,
     transcript_lang: str,
     ui_lang: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    backend: str = "faster-whisper",
+    compute_type: str = "auto",
+    client: str = "",
+    cache_dir: Optional[Path] = None,
+    converted: Iterable[str] = (),
 ) -> Tuple[int, int]:
-    """Transcribe .ogg in ogg-collection; optional translation to English via Whisper."""
+    """
+    Transcribe .ogg in ogg-collection; optional translation to English via Whisper.
+    Files already in out_csv are skipped unless listed in converted (OGGs the convert
+    stage just wrote); new rows are appended as they complete, and the finished CSV
+    is rewritten sorted by filename.
+    """
     oggs = sorted(ogg_collection.glob("*.ogg"))
     if not oggs:
-        pd.DataFrame(columns=["filename", "voiceline"]).to_csv(out_csv, index=False, encoding="utf-8")
+        if not out_csv.exists():
+            write_csv_header(out_csv)
         print(tr(ui_lang, "csv_written", path=str(out_csv)))
         return 0, 0
 
-    device, compute_type = choose_device_and_compute_type()
     print(tr(ui_lang, "transcribe_step"))
-    print(tr(ui_lang, "transcribe_mode", device=device, ctype=compute_type))
-    print(tr(ui_lang, "using_model", model=model_name))
 
     # Validate/normalize audio language
     lang = (audio_lang or "auto").lower()
     if lang not in (["auto"] + ALLOWED_LANGS):
         raise ValueError(tr(ui_lang, "invalid_audio_lang", val=audio_lang))
 
-    task = None
+    task = "transcribe"
     if transcript_lang and transcript_lang.lower() == "en" and lang != "en":
         task = "translate"
         print(tr(ui_lang, "translating_to_en"))
@@ -393,29 +1129,45 @@ def stage_transcribe(
         print(tr(ui_lang, "whisper_lang_hint", lang=lang))
         lang_hint = lang
 
-    model = WhisperModel(model_name, device=device, compute_type=compute_type)
+    done = load_done(out_csv, stale=converted)
+    todo = [ogg for ogg in oggs if ogg.name not in done]
+    if len(todo) < len(oggs):
+        print(tr(ui_lang, "resume_skip", n=len(oggs) - len(todo)))
+    if not todo:
+        print(tr(ui_lang, "csv_written", path=str(out_csv)))
+        return 0, 0
 
-    rows, failures = [], 0
-    for ogg in tqdm(oggs, desc="whisper", unit="file"):
-        try:
-            segments, _ = model.transcribe(
-                str(ogg),
-                language=lang_hint,
-                vad_filter=True,
-                beam_size=5,
-                best_of=5,
-                condition_on_previous_text=False,
-                task=task,
-            )
-            text = "".join(seg.text for seg in segments).strip()
-        except Exception as e:
-            failures += 1
-            text = f"[ERROR: {e}]"
-        rows.append({"filename": ogg.name, "voiceline": text})
-
-    pd.DataFrame(rows, columns=["filename", "voiceline"]).to_csv(out_csv, index=False, encoding="utf-8")
+    # Identical audio under several names (localization aliases) is transcribed once
+    groups = group_identical(todo)
+    if len(groups) < len(todo):
+        print(tr(ui_lang, "dedup_info", u=len(groups), n=len(todo)))
+    aliases = {ogg.name: group for ogg, group in groups.items()}
+
+    if client:
+        print(tr(ui_lang, "using_server", addr=client))
+        transcribe = remote_transcriber(client)
+    else:
+        transcribe = load_transcriber(
+            backend, model_name, compute_type, batch_size, ui_lang, cache_dir or default_cache_dir()
+        )
+
+    # Append and flush row by row: an interrupted run keeps everything finished so far
+    if not out_csv.exists() or out_csv.stat().st_size == 0:
+        write_csv_header(out_csv)
+    written, failures = 0, 0
+    with out_csv.open("a", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        unique = list(groups)
+        for name, text, ok in _pbar(transcribe(unique, lang_hint, task), total=len(unique), desc="whisper", unit="file"):
+            for ogg in aliases[name]:
+                w.writerow([ogg.name, text])
+                written += 1
+                failures += not ok
+            f.flush()
+    # Rows arrive in completion order; restore the filename order once everything is in
+    write_csv_header(out_csv, sorted(read_rows(out_csv)))
     print(tr(ui_lang, "csv_written", path=str(out_csv)))
-    return len(rows), failures
+    return written, failures
 
 
 def cleanup_wem(wem_collection: Path, ui_lang: str) -> int:
@@ -434,39 +1186,85 @@ def cleanup_wem(wem_collection: Path, ui_lang: str) -> int:
 
 # ----------------------------- main -----------------------------
 
+def add_transcription_args(p: argparse.ArgumentParser, ui_lang: str) -> None:
+    """Add the model/backend options shared by the pipeline and the server."""
+    p.add_argument("--model", default="small", help=tr(ui_lang, "arg_model"))
+    p.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=tr(ui_lang, "arg_batch_size"))
+    p.add_argument("--backend", default=BACKENDS[0], choices=BACKENDS, help=tr(ui_lang, "arg_backend"))
+    p.add_argument("--compute-type", default="auto", help=tr(ui_lang, "arg_compute_type"))
+    p.add_argument("--cache-dir", default="", help=tr(ui_lang, "arg_cache_dir"))
+
+
 def build_parser(ui_lang: str) -> argparse.ArgumentParser:
     """Build a localized argparse parser."""
     p = argparse.ArgumentParser(description=tr(ui_lang, "app_desc"))
     p.add_argument("-d", "--dir", required=True, help=tr(ui_lang, "arg_dir"))
     p.add_argument("-t", "--txt", required=True, help=tr(ui_lang, "arg_txt"))
-    p.add_argument("--model", default="small", help=tr(ui_lang, "arg_model"))
+    add_transcription_args(p, ui_lang)
     p.add_argument("--audio-lang", default="auto", help=tr(ui_lang, "arg_audio_lang"))
     p.add_argument("--ui-lang", default="system", help=tr(ui_lang, "arg_ui_lang"))
     p.add_argument("--transcript-lang", default="", help=tr(ui_lang, "arg_transcript_lang"))
+    p.add_argument("--copy-mode", default=COPY_MODES[0], choices=COPY_MODES, help=tr(ui_lang, "arg_copy_mode"))
+    p.add_argument("--client", default="", metavar="HOST:PORT", help=tr(ui_lang, "arg_client"))
     return p
 
 
+def build_serve_parser(ui_lang: str) -> argparse.ArgumentParser:
+    """Build a localized argparse parser for `wem2csv serve`."""
+    p = argparse.ArgumentParser(prog="wem2csv serve", description=tr(ui_lang, "serve_desc"))
+    add_transcription_args(p, ui_lang)
+    p.add_argument("--host", default="127.0.0.1", help=tr(ui_lang, "arg_host"))
+    p.add_argument("--port", type=int, default=DEFAULT_PORT, help=tr(ui_lang, "arg_port"))
+    p.add_argument("--ui-lang", default="system", help=tr(ui_lang, "arg_ui_lang"))
+    return p
+
+
+def resolve_ui_lang(value: str, system_lang: str) -> str:
+    """Final UI language: explicit override, else system language (fallback en)."""
+    ui_lang = value.lower().strip()
+    if ui_lang == "system":
+        ui_lang = system_lang
+    if ui_lang not in I18N:
+        ui_lang = "en"
+    return ui_lang
+
+
+def resolve_cache_dir(value: str) -> Path:
+    """--cache-dir if given, else the per-user default."""
+    return Path(value).expanduser().resolve() if value.strip() else default_cache_dir()
+
+
+def serve_main(argv: List[str], system_lang: str) -> None:
+    """Entry point for `wem2csv serve`: load the model once and serve transcription requests."""
+    args = build_serve_parser(system_lang).parse_args(argv)
+    ui_lang = resolve_ui_lang(args.ui_lang, system_lang)
+    transcribe = load_transcriber(
+        args.backend, args.model.strip(), args.compute_type.strip().lower(), max(1, args.batch_size), ui_lang,
+        resolve_cache_dir(args.cache_dir),
+    )
+    serve(transcribe, args.host, args.port, ui_lang)
+
+
 def main():
     """
     Entry point:
       - Collect .wem (listed in TXT) from --dir into ./wem-collection
-      - Convert to .ogg (ww2ogg + revorb) using ./tools
-      - Move to ./ogg-collection
-      - Transcribe with Whisper to CSV (filename, voiceline), optional EN translation
+      - Convert to .ogg (ww2ogg + revorb) using ./tools and move to ./ogg-collection, per file
+      - Transcribe with Whisper to CSV (filename, voiceline), optional EN translation;
+        with --client the transcription runs in a resident `wem2csv serve` process
       - Clean up .wem on full success
       - CLI language defaults to system locale (fallback en); audio-lang defaults to auto
     """
     # Decide UI language from system (before parsing, to localize --help)
     system_lang = detect_system_lang()
+    if sys.argv[1:2] == ["serve"]:
+        serve_main(sys.argv[2:], system_lang)
+        return
     parser = build_parser(system_lang)
     args = parser.parse_args()
 
     # Final UI language: allow explicit override
-    ui_lang = args.ui_lang.lower().strip()
-    if ui_lang == "system":
-        ui_lang = system_lang
-    if ui_lang not in I18N:
-        ui_lang = "en"
+    ui_lang = resolve_ui_lang(args.ui_lang, system_lang)
 
     # Use the project root (parent of the package directory) as the base directory
     base_dir = Path(__file__).resolve().parent.parent
@@ -496,14 +1294,12 @@ def main():
         return
 
     safe_mkdir(wem_dir)
-    copied = stage_collect_wem(wem_names, search_dir, wem_dir, ui_lang)
+    copied = stage_collect_wem(wem_names, search_dir, wem_dir, ui_lang, copy_mode=args.copy_mode)
     if copied == 0:
         print(tr(ui_lang, "none_found_abort"))
         return
 
-    ww_errs = stage_ww2ogg(wem_dir, tools_dir, ui_lang)
-    rv_errs = stage_revorb(wem_dir, tools_dir, ui_lang)
-    moved = stage_move_ogg(wem_dir, ogg_dir, ui_lang)
+    ww_errs, rv_errs, converted, skipped = stage_convert(wem_dir, ogg_dir, tools_dir, ui_lang)
 
     total, failures = stage_transcribe(
         ogg_dir, out_csv,
@@ -511,9 +1307,15 @@ def main():
         audio_lang=(args.audio_lang or "auto").strip().lower(),
         transcript_lang=(args.transcript_lang or "").strip().lower(),
         ui_lang=ui_lang,
+        batch_size=max(1, args.batch_size),
+        backend=args.backend,
+        compute_type=args.compute_type.strip().lower(),
+        client=args.client.strip(),
+        cache_dir=resolve_cache_dir(args.cache_dir),
+        converted=converted,
     )
 
-    success = (ww_errs == 0) and (rv_errs == 0) and (moved > 0) and (failures == 0)
+    success = (ww_errs == 0) and (rv_errs == 0) and (len(converted) + skipped > 0) and (failures == 0)
     if success:
         cleanup_wem(wem_dir, ui_lang)
     # else keep .wem for troubleshooting